@@ -17,8 +17,14 @@ if not openai_api_key:
     st.info("Please add your OpenAI API key to continue.", icon="🗝️")
 else:
 
-    # Create an OpenAI client.
-    client = OpenAI(api_key=openai_api_key)
+    # Create an OpenAI client and store it in session state, so its HTTP connection
+    # pool is reused across reruns. Recreate it only if the API key has changed.
+    if (
+        "openai_client" not in st.session_state
+        or st.session_state.openai_client.api_key != openai_api_key
+    ):
+        st.session_state.openai_client = OpenAI(api_key=openai_api_key)
+    client = st.session_state.openai_client
 
     # Create a session state variable to store the chat messages. This ensures that the
     # messages persist across reruns.